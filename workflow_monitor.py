@@ -4,19 +4,63 @@ Workflow Monitor - Scans GitHub repos for failed workflows and logs issues.
 """
 import os
 import json
-import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+import requests
+from github import Auth, Github, GithubException
+
+DEFAULT_LOOKBACK_HOURS = 24
+MAX_LOOKBACK_HOURS = 10 * 365 * 24
+
+def _lookback_hours():
+    """How far back to check for failures (hours), from LOOKBACK_HOURS."""
+    value = os.environ.get('LOOKBACK_HOURS') or str(DEFAULT_LOOKBACK_HOURS)
+    try:
+        hours = int(value)
+    except ValueError:
+        hours = None
+    if hours is None or not 0 < hours <= MAX_LOOKBACK_HOURS:
+        print(f"⚠️  Invalid LOOKBACK_HOURS={value!r}, using {DEFAULT_LOOKBACK_HOURS}")
+        return DEFAULT_LOOKBACK_HOURS
+    return hours
+
+LOOKBACK_HOURS = _lookback_hours()
+MAX_RUNS = 20
+API_TIMEOUT = 15  # seconds
+ISO_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
 def get_failed_workflows():
-    """Get list of failed workflow runs."""
-    result = subprocess.run(
-        ['gh', 'run', 'list', '--status', 'failure', '--limit', '20', '--json', 
-         'databaseId,name,conclusion,createdAt,headBranch'],
-        capture_output=True, text=True
-    )
-    if result.returncode == 0:
-        return json.loads(result.stdout)
-    return []
+    """Get list of failed workflow runs within the lookback window."""
+    token = os.environ.get('GH_TOKEN') or os.environ.get('GITHUB_TOKEN')
+    repo_name = os.environ.get('GITHUB_REPOSITORY')
+    if not token or not repo_name:
+        print("⚠️  GH_TOKEN or GITHUB_TOKEN, and GITHUB_REPOSITORY must be set")
+        return []
+
+    since = datetime.now(timezone.utc) - timedelta(hours=LOOKBACK_HOURS)
+    try:
+        # Fail fast like gh did: no rate-limit sleeps or retries on the runner
+        github = Github(
+            auth=Auth.Token(token), per_page=MAX_RUNS, timeout=API_TIMEOUT, retry=None
+        )
+        repo = github.get_repo(repo_name, lazy=True)
+        runs = repo.get_workflow_runs(
+            status='failure', created=f">={since.strftime(ISO_FORMAT)}"
+        )
+        return [
+            {
+                'databaseId': run.id,
+                'name': run.name,
+                'conclusion': run.conclusion,
+                'createdAt': run.created_at.strftime(ISO_FORMAT),
+                'headBranch': run.head_branch,
+            }
+            for run in islice(runs, MAX_RUNS)
+        ]
+    except (GithubException, requests.exceptions.RequestException) as e:
+        print(f"⚠️  Failed to list workflow runs for {repo_name}: {e}")
+        return []
 
 def log_failures(failures):
     """Log failures to file."""
@@ -24,12 +68,13 @@ def log_failures(failures):
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = f'logs/failures_{timestamp}.json'
     
+    payload = json.dumps({
+        'timestamp': timestamp,
+        'failure_count': len(failures),
+        'failures': failures
+    }, indent=2)
     with open(log_file, 'w') as f:
-        json.dump({
-            'timestamp': timestamp,
-            'failure_count': len(failures),
-            'failures': failures
-        }, f, indent=2)
+        f.write(payload)
     
     print(f"Logged {len(failures)} failures to {log_file}")
     return log_file